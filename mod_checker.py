@@ -1,39 +1,29 @@
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Dict, List, Set
 import argparse
 
-from rich.panel import Panel
-from rich.table import Table, box
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+from modchecker.utils import QUIET, console, extract_modrinth_links, top_versions, prompt_user
+
+if not QUIET:
+    from rich.console import Group
+    from rich.panel import Panel
+    from rich.table import Table, box
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from modchecker import ModInfo, VersionCheckResult, find_common_version
 from modchecker.cache import cache
-from modchecker.utils import console, extract_modrinth_links, sort_minecraft_versions, prompt_user
-from modchecker.modrinth_api import check_mod_version
+from modchecker.modrinth_api import bulk_fetch_projects, check_mods_concurrently, reset_caches
 from modchecker.compatibility import (
+    ALL_LOADERS,
     find_next_compatible_version,
     check_loader_compatibility,
     find_best_loader,
 )
-from modchecker.downloader import download_mod, process_dependencies
+from modchecker.downloader import download_mods, process_dependencies
 from modchecker.report import generate_compatibility_report
 
 
-def check_alternative_loaders(mods: List[Dict[str, str]], version: str, current_loader: str) -> Dict[str, List[ModInfo]]:
-    all_loaders = {'fabric', 'forge', 'quilt', 'neoforge'} - {current_loader}
-    loader_results: Dict[str, List[ModInfo]] = {}
-
-    for loader in all_loaders:
-        results: List[ModInfo] = []
-        for mod in mods:
-            result = check_mod_version(mod['slug'], version, loader)
-            results.append(result)
-        if all(mod.available for mod in results):
-            loader_results[loader] = results
-
-    return loader_results
-
-
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="""
@@ -50,9 +40,9 @@ Example usage:
 
     parser.add_argument('--version', required=True,
                         help='Minecraft version to check compatibility with (e.g., "1.20.4")')
-    parser.add_argument('--loader', required=True, choices=['fabric', 'forge', 'quilt', 'neoforge'],
+    parser.add_argument('--loader', required=True, choices=sorted(ALL_LOADERS),
                         help='Mod loader type (fabric, forge, quilt, or neoforge)')
-    parser.add_argument('--preferred-alt-loader', choices=['fabric', 'forge', 'quilt', 'neoforge'],
+    parser.add_argument('--preferred-alt-loader', choices=sorted(ALL_LOADERS),
                         help='Preferred alternative loader if current loader is incompatible')
     parser.add_argument('--input', default='TheGreatSpaceProject.md',
                         help='Input file containing mod IDs or URLs (default: TheGreatSpaceProject.md)')
@@ -64,51 +54,91 @@ Example usage:
                         help='Allow checking older versions if current version is incompatible')
     parser.add_argument('--auto-accept', action='store_true',
                         help='Automatically accept version and loader changes')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Ignore cached Modrinth responses and fetch fresh data')
+    parser.add_argument('--quiet', action='store_true',
+                        help='Plain-text output without rich rendering (for CI/scripts)')
 
     return parser.parse_args()
 
 
+def make_progress() -> "Progress":
+    """Build the shared transient progress bar (rich mode only)."""
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+        transient=True,
+    )
+
+
 def main() -> None:
     args = parse_args()
     original_version = args.version
     original_loader = args.loader
 
-    args.output_dir = str(Path(args.output_dir))
+    # Long-lived embedders (tests, repeated programmatic runs) should not see
+    # results leak between invocations.
+    reset_caches()
+
+    if args.no_cache:
+        cache.enabled = False
 
-    console.print(Panel.fit(
-        f"[blue]{args.input}[/]\n",
-        f"Checking mods for Minecraft {args.version} using {args.loader}",
-        title="[bold green]Minecraft Mod Checker[/]",
-    ))
+    # Validate everything the run depends on before printing the banner or
+    # touching the network, so a typo doesn't cost a full API pass.
+    input_path = Path(args.input)
+    if not input_path.is_file():
+        raise SystemExit(f"Error: input file not found: {input_path}")
+
+    args.output_dir = Path(args.output_dir)
+    if args.download:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+
+    mods: List[Dict[str, str]] = extract_modrinth_links(args.input)
+    if not mods:
+        raise SystemExit(1)
+
+    if QUIET:
+        console.print(f"{args.input}")
+        console.print(f"Checking mods for Minecraft {args.version} using {args.loader}")
+    else:
+        console.print(Panel(
+            Group(
+                f"[blue]{args.input}[/]",
+                f"Checking mods for Minecraft {args.version} using {args.loader}",
+            ),
+            title="[bold green]Minecraft Mod Checker[/]",
+            expand=False,
+        ))
 
     if args.preferred_alt_loader:
         console.print(f"[dim]Preferred alternative loader: {args.preferred_alt_loader}[/]")
 
     processed_mods: Set[str] = set()
-    mods: List[Dict[str, str]] = extract_modrinth_links(args.input)
     version_checks: List[VersionCheckResult] = []
 
-    if not mods:
-        return
+    bulk_fetch_projects([mod['slug'] for mod in mods])
 
-    results: List[ModInfo] = []
-    for mod in mods:
-        result = check_mod_version(mod['slug'], args.version, args.loader)
-        results.append(result)
+    results: List[ModInfo] = check_mods_concurrently(mods, args.version, args.loader)
 
-    incompatible_mods: List[ModInfo] = [mod for mod in results if not mod.available]
+    compatible_mods: List[ModInfo] = []
+    incompatible_mods: List[ModInfo] = []
+    for mod in results:
+        (compatible_mods if mod.available else incompatible_mods).append(mod)
 
     if incompatible_mods:
         console.print(f"\nSome mods are not compatible with Minecraft {args.version} using {args.loader}:")
         for mod in incompatible_mods:
             console.print(f"- [red]{mod.name}[/]")
             if mod.versions:
-                console.print(f"  Available versions: [cyan]{', '.join(sort_minecraft_versions(mod.versions)[:5])}...")
+                console.print(f"  Available versions: [cyan]{', '.join(top_versions(mod.versions, 5))}...")
 
         common_version = find_common_version(results)
         if common_version:
             console.print(f"\n[green]Found a version compatible with all mods: {common_version}[/]")
-            best_loader, best_results, loader_stats = find_best_loader(
+            best_loader, best_results, loader_stats, per_loader_results = find_best_loader(
                 mods, common_version, args.loader, args.preferred_alt_loader
             )
             current_compatible = loader_stats[args.loader]
@@ -134,7 +164,7 @@ def main() -> None:
                         results = best_results
                     elif prompt_user(f"Would you like to use version {common_version} with {args.loader}?"):
                         args.version = common_version
-                        results = [check_mod_version(mod['slug'], args.version, args.loader) for mod in mods]
+                        results = per_loader_results[args.loader]
             else:
                 if args.auto_accept:
                     args.version = common_version
@@ -142,12 +172,20 @@ def main() -> None:
                 elif prompt_user(f"Would you like to use version {common_version}?"):
                     args.version = common_version
 
-                results = [check_mod_version(mod['slug'], args.version, args.loader) for mod in mods]
+                if args.version == common_version:
+                    results = per_loader_results[args.loader]
         else:
             next_version, version_checks = find_next_compatible_version(results, args.version, args.loader, args.allow_downgrade)
             if not next_version:
                 console.print("\n[yellow]Checking alternative mod loaders...[/]")
-                alternative_loaders = check_alternative_loaders(mods, args.version, args.loader)
+                _, _, _, per_loader_results = find_best_loader(
+                    mods, args.version, args.loader, args.preferred_alt_loader
+                )
+                alternative_loaders = {
+                    loader: loader_mods
+                    for loader, loader_mods in per_loader_results.items()
+                    if loader != args.loader and all(mod.available for mod in loader_mods)
+                }
 
                 if alternative_loaders:
                     console.print("\n[green]Found compatible loader(s):[/]")
@@ -175,55 +213,64 @@ def main() -> None:
                     if common_version:
                         console.print(f"\n[yellow]Consider using version {common_version} which is compatible with all mods.[/]")
 
+    if incompatible_mods:
+        # results may have been swapped for a different version/loader above;
+        # refresh the classification the later phases rely on.
+        compatible_mods = [mod for mod in results if mod.available]
+
     console.print(f"\nResults for Minecraft {args.version} ({args.loader}):")
 
-    table = Table(box=box.ROUNDED)
-    table.add_column("Status", justify="center")
-    table.add_column("Mod", style="bold")
-    table.add_column("Details", style="dim")
+    downloaded: Dict[str, bool] = {}
+    dependencies: List[ModInfo] = []
 
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-        transient=True,
-    ) as progress:
+    # One Progress spans the mod downloads and the dependency phase: a single
+    # live-render loop for the whole run instead of one per phase (rich
+    # interleaves the prints between them cleanly).
+    download_phase = args.download and bool(compatible_mods)
+    with (make_progress() if download_phase and not QUIET else nullcontext()) as progress:
+        if download_phase:
+            downloaded = download_mods(compatible_mods, args.output_dir, progress)
+
+        rows: List[tuple] = []
         for mod in results:
-            status = "[green]+[/]" if mod.available else "[red]-[/]"
             details: List[str] = []
             if mod.available and args.download:
-                if download_mod(mod, args.output_dir, progress):
+                if downloaded.get(mod.slug):
                     details.append(f"Downloaded to {args.output_dir}/{mod.filename}")
             elif not mod.available:
                 details.append("Not available")
                 if mod.versions:
-                    sorted_versions = sort_minecraft_versions(mod.versions)
-                    details.append(f"Available versions: {', '.join(sorted_versions[:3])}...")
+                    details.append(f"Available versions: {', '.join(top_versions(mod.versions, 3))}...")
                 if mod.loader_types:
                     details.append(f"Supported loaders: {', '.join(mod.loader_types)}")
-            table.add_row(status, mod.name, "\n".join(details))
+            rows.append((mod, details))
 
-    console.print(table)
-
-    dependencies: List[ModInfo] = []
-    if args.download:
-        console.print("\nChecking for required dependencies...")
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-            transient=True,
-        ) as progress:
-            for mod in results:
-                if mod.available:
-                    deps = process_dependencies(mod, args.version, args.loader, processed_mods, args.output_dir, progress)
-                    dependencies.extend(deps)
-        if dependencies:
-            console.print("\n\nDependency Summary:")
+        if QUIET:
+            for mod, details in rows:
+                marker = '+' if mod.available else '-'
+                suffix = f" ({'; '.join(details)})" if details else ""
+                console.print(f"{marker} {mod.name}{suffix}")
+        else:
+            table = Table(box=box.ROUNDED)
+            table.add_column("Status", justify="center")
+            table.add_column("Mod", style="bold")
+            table.add_column("Details", style="dim")
+            for mod, details in rows:
+                status = "[green]+[/]" if mod.available else "[red]-[/]"
+                table.add_row(status, mod.name, "\n".join(details))
+            console.print(table)
+
+        if download_phase:
+            console.print("\nChecking for required dependencies...")
+            dependencies = process_dependencies(results, args.version, args.loader, processed_mods, args.output_dir, progress)
+
+    if dependencies:
+        console.print("\n\nDependency Summary:")
+        if QUIET:
+            for dep in dependencies:
+                marker = '+' if dep.available else '-'
+                console.print(f"{marker} {dep.name} (dependency)")
+        else:
             dep_table = Table(box=box.ROUNDED)
             dep_table.add_column("Status", justify="center")
             dep_table.add_column("Dependency", style="bold")
@@ -232,7 +279,7 @@ def main() -> None:
                 dep_table.add_row(status, f"{dep.name} (dependency)")
             console.print(dep_table)
 
-    report_content = generate_compatibility_report(
+    report_lines = generate_compatibility_report(
         original_version=original_version,
         final_version=args.version,
         original_loader=original_loader,
@@ -244,7 +291,7 @@ def main() -> None:
 
     report_file = 'mod_compatibility_report.md'
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(report_content)
+        f.writelines(report_lines)
 
     console.print(f"\n[dim]Detailed report saved to {report_file}[/]")
 
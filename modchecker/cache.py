@@ -1,112 +1,217 @@
 import json
+import sqlite3
+import threading
 import time
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+try:  # optional: markedly faster (de)serialization on the cache hot path
+    import orjson
+
+    def _loads(data: bytes) -> dict:
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _loads(data: bytes) -> dict:
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+# Upper bound on simultaneous Modrinth API requests, shared by the checker
+# thread pool and enforced again at the wire in make_request so no future
+# caller can exceed it by accident.
+MAX_CONCURRENT_REQUESTS = 8
 
 CACHE_DIR = Path("modrinth_cache")
+CACHE_DB = CACHE_DIR / "modrinth.db"
 CACHE_DURATION = 3600  # 1 hour in seconds
 
+# One pooled session for every Modrinth request (API and downloads): keeps
+# TLS connections alive across calls and retries transient failures with
+# backoff instead of surfacing them per mod.
+session = requests.Session()
+session.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504)),
+))
+session.headers["User-Agent"] = "MrPlayerYork/MinecraftModChecker (github.com/MrPlayerYork/MinecraftModChecker)"
+
 
 class ModrinthCache:
-    """Simple filesystem cache for Modrinth API requests."""
+    """SQLite-backed cache for Modrinth API requests.
+
+    One row per (slug, key) entry, so a write touches a single row instead
+    of rewriting a whole per-slug JSON file, and WAL mode lets the pooled
+    checkers write concurrently. Parsed entries are additionally kept in
+    memory for the life of the process.
+    """
 
     def __init__(self) -> None:
         self.cache_dir = CACHE_DIR
-        self.cache_dir.mkdir(exist_ok=True)
+        if not self.cache_dir.exists():
+            self.cache_dir.mkdir(exist_ok=True)
+        self.enabled = True
         self.rate_limit = 300
         self.rate_remaining = 300
         self.rate_reset = 0
-        self.last_request_time = 0
         self.min_request_interval = 0.1
+        # Token-bucket cursor: the monotonic time at which the next request
+        # may start. Each caller reserves a slot and advances it.
+        self.next_allowed = time.monotonic()
+        # Concurrent checkers all funnel through make_request; rate-limit
+        # bookkeeping has to stay consistent across threads.
+        self._rate_lock = threading.Lock()
+        self._request_sem = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+        self._mem: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+        self._mem_lock = threading.Lock()
+        self._db = sqlite3.connect(CACHE_DB, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " slug TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " cached_at REAL NOT NULL,"
+            " data BLOB NOT NULL,"
+            " PRIMARY KEY (slug, key)"
+            ") WITHOUT ROWID"
+        )
+        # Response bodies keyed by URL with their ETag, so expired entries
+        # can be revalidated with a conditional GET instead of re-downloaded.
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS etags ("
+            " url TEXT PRIMARY KEY,"
+            " etag TEXT NOT NULL,"
+            " body BLOB NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self._db_lock = threading.Lock()
+
+    def _get_entry(self, mod_slug: str, key: str) -> Optional[dict]:
+        if not self.enabled:
+            return None
+        with self._mem_lock:
+            entry = self._mem.get((mod_slug, key))
+        if entry is None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT cached_at, data FROM cache WHERE slug = ? AND key = ?",
+                    (mod_slug, key),
+                ).fetchone()
+            if row is None:
+                return None
+            try:
+                entry = (row[0], _loads(row[1]))
+            except ValueError:
+                return None
+            with self._mem_lock:
+                self._mem[(mod_slug, key)] = entry
+        cached_at, data = entry
+        if time.time() - cached_at < CACHE_DURATION:
+            return data
+        return None
 
-    def _get_mod_cache_file(self, mod_slug: str) -> Path:
-        return self.cache_dir / f"{mod_slug}.json"
+    def _put_entry(self, mod_slug: str, key: str, data) -> None:
+        now = time.time()
+        with self._mem_lock:
+            self._mem[(mod_slug, key)] = (now, data)
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache (slug, key, cached_at, data) VALUES (?, ?, ?, ?)",
+                (mod_slug, key, now, _dumps(data)),
+            )
 
     def get_all_data(self, mod_slug: str) -> Optional[dict]:
-        cache_file = self._get_mod_cache_file(mod_slug)
-        if cache_file.exists():
-            try:
-                cache_data = json.loads(cache_file.read_text())
-                key = f"{mod_slug}_all"
-                if key in cache_data:
-                    entry = cache_data[key]
-                    if time.time() - entry["cached_at"] < CACHE_DURATION:
-                        return entry["data"]
-            except (json.JSONDecodeError, KeyError):
-                pass
-        return None
+        return self._get_entry(mod_slug, "_all")
 
     def cache_all_data(self, mod_slug: str, data: dict) -> None:
-        cache_file = self._get_mod_cache_file(mod_slug)
-        if cache_file.exists():
-            try:
-                cache_data = json.loads(cache_file.read_text())
-            except json.JSONDecodeError:
-                cache_data = {}
-        else:
-            cache_data = {}
-
-        cache_data[f"{mod_slug}_all"] = {
-            "cached_at": time.time(),
-            "data": data,
-        }
-        cache_file.write_text(json.dumps(cache_data, indent=2))
+        self._put_entry(mod_slug, "_all", data)
 
     def get_cached_data(self, mod_slug: str, version: str, loader: str) -> Optional[dict]:
-        cache_file = self._get_mod_cache_file(mod_slug)
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cache_data = json.load(f)
-                version_key = f"{version}_{loader}"
-                if version_key in cache_data:
-                    data = cache_data[version_key]
-                    if time.time() - data["cached_at"] < CACHE_DURATION:
-                        return data["data"]
-            except (json.JSONDecodeError, KeyError, OSError):
-                pass
-        return None
+        return self._get_entry(mod_slug, f"{version}_{loader}")
 
     def cache_data(self, mod_slug: str, version: str, loader: str, data: dict) -> None:
-        cache_file = self._get_mod_cache_file(mod_slug)
-        version_key = f"{version}_{loader}"
-        if cache_file.exists():
-            try:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    cache_data = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                cache_data = {}
-        else:
-            cache_data = {}
-
-        cache_data[version_key] = {
-            "cached_at": time.time(),
-            "data": data,
-        }
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f, separators=(",", ":"))
+        self._put_entry(mod_slug, f"{version}_{loader}", data)
+
+    def has_cached_data(self, mod_slug: str, version: str, loader: str) -> bool:
+        """Return True if a fresh cache entry exists for (slug, version, loader)."""
+        return self.get_cached_data(mod_slug, version, loader) is not None
 
     def update_rate_limits(self, headers: Dict[str, str]) -> None:
-        self.rate_limit = int(headers.get("X-Ratelimit-Limit", 300))
-        self.rate_remaining = int(headers.get("X-Ratelimit-Remaining", 300))
-        self.rate_reset = int(headers.get("X-Ratelimit-Reset", 0))
+        with self._rate_lock:
+            self.rate_limit = int(headers.get("X-Ratelimit-Limit", 300))
+            self.rate_remaining = int(headers.get("X-Ratelimit-Remaining", 300))
+            self.rate_reset = int(headers.get("X-Ratelimit-Reset", 0))
 
     def should_wait(self) -> float:
-        if self.rate_remaining < 10:
-            return max(0, self.rate_reset)
-        time_since_last = time.time() - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            return self.min_request_interval - time_since_last
-        return 0
+        """Reserve the next request slot and return how long to sleep for it.
+
+        Requests are paced to spend the remaining quota evenly across the
+        reset window (``X-Ratelimit-Reset`` is seconds until reset), instead
+        of burning through it and then stalling for the whole window.
+        """
+        with self._rate_lock:
+            interval = max(self.min_request_interval, self.rate_reset / max(self.rate_remaining, 1))
+            now = time.monotonic()
+            slot = max(self.next_allowed, now)
+            self.next_allowed = slot + interval
+            return slot - now
+
+    def _get_etag(self, url: str) -> Optional[Tuple[str, bytes]]:
+        with self._db_lock:
+            row = self._db.execute("SELECT etag, body FROM etags WHERE url = ?", (url,)).fetchone()
+        return row
+
+    def _store_etag(self, url: str, etag: str, body: bytes) -> None:
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO etags (url, etag, body) VALUES (?, ?, ?)",
+                (url, etag, body),
+            )
 
     def make_request(self, url: str) -> requests.Response:
         wait_time = self.should_wait()
         if wait_time > 0:
             time.sleep(wait_time)
-        response = requests.get(url)
-        self.last_request_time = time.time()
+
+        # Modrinth serves ETags: revalidating an expired entry costs a
+        # bodyless 304 instead of re-downloading a version list that can run
+        # to hundreds of KB. (The session already negotiates gzip.)
+        etag_entry = self._get_etag(url) if self.enabled else None
+        headers = {"If-None-Match": etag_entry[0]} if etag_entry else None
+
+        with self._request_sem:
+            response = session.get(url, headers=headers)
         self.update_rate_limits(response.headers)
+
+        # urllib3's Retry already honors Retry-After while retrying; if a 429
+        # still escapes, push the bucket cursor past the server's ask so the
+        # other threads stop queueing requests into the closed window.
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get("Retry-After", 0))
+            except ValueError:
+                retry_after = 0.0
+            if retry_after > 0:
+                with self._rate_lock:
+                    self.next_allowed = max(self.next_allowed, time.monotonic() + retry_after)
+
+        if response.status_code == 304 and etag_entry:
+            revalidated = requests.Response()
+            revalidated.status_code = 200
+            revalidated._content = etag_entry[1]
+            revalidated.headers = response.headers
+            revalidated.url = url
+            return revalidated
+
+        etag = response.headers.get("ETag")
+        if etag and response.ok and self.enabled:
+            self._store_etag(url, etag, response.content)
         return response
 
 
@@ -1,41 +1,92 @@
+import bisect
 from typing import Dict, List, Optional, Tuple
 
 from .models import ModInfo, VersionCheckResult
-from .modrinth_api import check_mod_version
+from .modrinth_api import (
+    build_support_index,
+    check_mod_version,
+    evaluate_loaders_concurrently,
+    fetch_version_data,
+)
 from .utils import parse_minecraft_version, sort_minecraft_versions
 
+# The loader universe is fixed and tiny; build it once instead of allocating
+# a fresh set on every call.
+ALL_LOADERS = frozenset(("fabric", "forge", "neoforge", "quilt"))
+
 
 def check_version_compatibility(mods_info: List[ModInfo], test_version: str, loader_type: str) -> VersionCheckResult:
     incompatible_mods: List[Tuple[str, List[str]]] = []
     for mod in mods_info:
-        result = check_mod_version(mod.slug, test_version, loader_type)
-        if not result.available:
-            incompatible_mods.append((mod.name, result.versions))
+        # The support index answers the (version, loader) question without
+        # rebuilding a ModInfo per probe; the full check only runs when the
+        # mod's data couldn't be fetched.
+        index = build_support_index(mod.slug)
+        if index is None:
+            result = check_mod_version(mod.slug, test_version, loader_type)
+            if not result.available:
+                incompatible_mods.append((mod.name, result.versions))
+        elif loader_type not in index.get(test_version, ()):
+            incompatible_mods.append((mod.name, mod.versions))
 
     return VersionCheckResult(version=test_version, compatible=len(incompatible_mods) == 0, incompatible_mods=incompatible_mods)
 
 
+def _supports(versions: List[dict], test_version: str, loader_type: str) -> bool:
+    """Scan raw version documents for a release matching (version, loader)."""
+    return any(
+        loader_type in ver["loaders"] and test_version in ver["game_versions"]
+        for ver in versions
+    )
+
+
 def find_next_compatible_version(
     mods_info: List[ModInfo],
     current_version: str,
     loader_type: str,
     allow_downgrade: bool = False,
 ) -> Tuple[Optional[str], List[VersionCheckResult]]:
-    all_versions = set()
+    # The support index answers (version, loader) per mod with set lookups,
+    # so the feasible pool is a single N-way intersection of the per-mod
+    # "versions this loader covers" sets. Mods whose index couldn't be built
+    # (network failure) are verified per candidate against whatever raw data
+    # is available instead of silently vetoing everything.
+    per_mod_compat = []
+    unindexed: List[ModInfo] = []
     for mod in mods_info:
-        all_versions.update(mod.versions)
-
-    sorted_versions = sort_minecraft_versions(list(all_versions))
-    current_ver = parse_minecraft_version(current_version)
-
+        index = build_support_index(mod.slug)
+        if index is None:
+            unindexed.append(mod)
+        else:
+            per_mod_compat.append({ver for ver, loaders in index.items() if loader_type in loaders})
+
+    if not per_mod_compat:
+        return None, []
+    candidates = set.intersection(*per_mod_compat)
+
+    # Decorate each candidate with its parsed key once; the ascending sort
+    # lets the no-downgrade cutoff be a single bisect instead of re-parsing
+    # every version for a >= comparison.
+    decorated = sorted((parse_minecraft_version(ver), ver) for ver in candidates)
     if not allow_downgrade:
-        sorted_versions = [v for v in sorted_versions if parse_minecraft_version(v) >= current_ver]
+        cutoff = bisect.bisect_left(decorated, (parse_minecraft_version(current_version),))
+        decorated = decorated[cutoff:]
+
+    version_data = {mod.slug: fetch_version_data(mod.slug) for mod in unindexed}
 
     version_checks: List[VersionCheckResult] = []
-    for test_version in sorted_versions:
+    for _, test_version in reversed(decorated):
         if test_version == current_version:
             continue
-        check_result = check_version_compatibility(mods_info, test_version, loader_type)
+        incompatible = [
+            (mod.name, mod.versions)
+            for mod in unindexed
+            if version_data[mod.slug] is None
+            or not _supports(version_data[mod.slug][1], test_version, loader_type)
+        ]
+        check_result = VersionCheckResult(
+            version=test_version, compatible=not incompatible, incompatible_mods=incompatible
+        )
         version_checks.append(check_result)
         if check_result.compatible:
             return test_version, version_checks
@@ -59,17 +110,25 @@ def find_best_loader(
     version: str,
     current_loader: str,
     preferred_loader: Optional[str] = None,
-) -> Tuple[str, List[ModInfo], Dict[str, int]]:
-    all_loaders = {"fabric", "forge", "neoforge", "quilt"}
-    loader_stats: Dict[str, int] = {}
+) -> Tuple[str, List[ModInfo], Dict[str, int], Dict[str, List[ModInfo]]]:
+    # One data fetch per mod covers all four loaders, and the per-mod
+    # fetches overlap on the shared thread pool; the sweep itself is
+    # in-memory filtering.
+    loader_stats: Dict[str, int] = dict.fromkeys(ALL_LOADERS, 0)
+    per_loader_results: Dict[str, List[ModInfo]] = {loader: [] for loader in ALL_LOADERS}
+
+    for by_loader in evaluate_loaders_concurrently(mods, version, ALL_LOADERS):
+        for loader, info in by_loader.items():
+            per_loader_results[loader].append(info)
+            if info.available:
+                loader_stats[loader] += 1
+
     best_loader = current_loader
     best_count = 0
     best_results: List[ModInfo] = []
 
-    for loader in all_loaders:
-        results, compatible_count = check_loader_compatibility(mods, version, loader)
-        loader_stats[loader] = compatible_count
-
+    for loader in ALL_LOADERS:
+        compatible_count = loader_stats[loader]
         is_better = False
         if compatible_count > best_count:
             is_better = True
@@ -81,18 +140,18 @@ def find_best_loader(
         if is_better:
             best_count = compatible_count
             best_loader = loader
-            best_results = results
+            best_results = per_loader_results[loader]
 
-    return best_loader, best_results, loader_stats
+    return best_loader, best_results, loader_stats, per_loader_results
 
 
 def find_common_version(mods: List[ModInfo]) -> Optional[str]:
     if not mods:
         return None
-    mod_versions = [set(mod.versions) for mod in mods if mod.versions]
+    mod_versions = [frozenset(mod.versions) for mod in mods if mod.versions]
     if not mod_versions:
         return None
-    common_versions = set.intersection(*mod_versions)
+    common_versions = frozenset.intersection(*mod_versions)
     if not common_versions:
         return None
     sorted_versions = sort_minecraft_versions([v for v in common_versions if "w" not in v and "snapshot" not in v])
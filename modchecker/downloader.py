@@ -1,15 +1,81 @@
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional, Set
+from typing import Dict, List, Optional, Set
 
 import requests
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
 
+from .cache import session
 from .models import ModInfo
-from .modrinth_api import check_mod_version, get_mod_dependencies, get_mod_name
-from .utils import console
+from .modrinth_api import (
+    bulk_fetch_projects,
+    bulk_fetch_versions,
+    check_mods_concurrently,
+    get_mod_dependencies,
+    get_mod_name,
+)
+from .utils import QUIET, console
+
+if not QUIET:
+    from rich.progress import Progress
+
+# Cap on simultaneous downloads so bulk fetches don't hammer Modrinth's CDN.
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# 256 KiB per read: mod jars run to tens of MB, and 8 KiB chunks meant
+# thousands of Python-level loop iterations (and progress updates) per file.
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+
+def _content_length(mod_info: ModInfo, output_dir: str) -> int:
+    """Size of a pending download in bytes, or 0 if unknown/already present."""
+    if Path(output_dir, mod_info.filename).exists():
+        return 0
+    try:
+        response = session.head(mod_info.download_url, allow_redirects=True)
+        return int(response.headers.get("content-length", 0))
+    except (requests.exceptions.RequestException, ValueError):
+        return 0
 
 
-def download_mod(mod_info: ModInfo, output_dir: str, progress: Optional[Progress] = None) -> bool:
+def download_mods(
+    mods: List[ModInfo], output_dir: str, progress: Optional[Progress] = None
+) -> Dict[str, bool]:
+    """Download every downloadable mod in parallel, keyed success by slug.
+
+    Rather than one progress task per file, the expected sizes are summed up
+    front (parallel HEAD requests) into a single aggregate bar: far fewer
+    render updates and a percentage that reflects the whole batch.
+    """
+    to_download = [mod for mod in mods if mod.available and mod.download_url and mod.filename]
+    if not to_download:
+        return {}
+
+    task = None
+    if progress is not None:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+            total = sum(executor.map(lambda mod: _content_length(mod, output_dir), to_download))
+        task = progress.add_task("Downloading mods...", total=total or None)
+
+    downloaded: Dict[str, bool] = {}
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+        futures = {
+            executor.submit(download_mod, mod, output_dir, progress, task): mod
+            for mod in to_download
+        }
+        for future in as_completed(futures):
+            downloaded[futures[future].slug] = future.result()
+    return downloaded
+
+
+def download_mod(
+    mod_info: ModInfo,
+    output_dir: str,
+    progress: Optional[Progress] = None,
+    task: Optional[int] = None,
+) -> bool:
     if not mod_info.available or not mod_info.download_url or not mod_info.filename:
         return False
 
@@ -19,33 +85,28 @@ def download_mod(mod_info: ModInfo, output_dir: str, progress: Optional[Progress
         return True
 
     try:
-        response = requests.get(mod_info.download_url, stream=True)
+        response = session.get(mod_info.download_url, stream=True)
         response.raise_for_status()
         output_path.parent.mkdir(parents=True, exist_ok=True)
         total_size = int(response.headers.get("content-length", 0))
 
         if progress:
-            task = progress.add_task(f"Downloading {mod_info.name}...", total=total_size)
+            # Advance the caller's aggregate task when given one; otherwise
+            # fall back to a task of our own on the shared bar.
+            if task is None:
+                task = progress.add_task(f"Downloading {mod_info.name}...", total=total_size)
             with open(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         progress.update(task, advance=len(chunk))
         else:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                console=console,
-                transient=True,
-            ) as p:
-                task = p.add_task(f"Downloading {mod_info.name}...", total=total_size)
-                with open(output_path, "wb") as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        if chunk:
-                            f.write(chunk)
-                            p.update(task, advance=len(chunk))
+            # No progress supplied (quiet mode, or a bare programmatic call):
+            # just stream to disk rather than spinning up a private Progress.
+            with open(output_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
         return True
     except requests.exceptions.RequestException as e:
         console.print(f"[red]Error downloading {mod_info.name}: {str(e)}[/]")
@@ -53,38 +114,75 @@ def download_mod(mod_info: ModInfo, output_dir: str, progress: Optional[Progress
 
 
 def process_dependencies(
-    mod_info: ModInfo,
+    mods: List[ModInfo],
     version: str,
     loader: str,
     processed_mods: Set[str],
     output_dir: str,
     parent_progress: Optional[Progress] = None,
 ) -> List[ModInfo]:
-    if not mod_info.version_id or not mod_info.available:
-        return []
+    """Resolve and download required dependencies for all mods breadth-first.
 
+    A single worklist covers the whole dependency graph, with
+    ``processed_mods`` as the shared visited set, so transitive dependencies
+    common to several mods (Fabric API and friends) are checked exactly once
+    and cycles cannot recurse.
+    """
+    queue = deque(mod for mod in mods if mod.available and mod.version_id)
     dependency_results: List[ModInfo] = []
-    dependencies = get_mod_dependencies(mod_info.version_id)
-
-    if dependencies:
-        console.print(f"\n[yellow]Processing dependencies for {mod_info.name}[/]:")
-
-    for dep in dependencies:
-        dep_id = dep.get("project_id")
-        if not dep_id or dep_id in processed_mods:
-            continue
-
-        processed_mods.add(dep_id)
-        dep_name = get_mod_name(dep_id)
-        if dep_name:
-            console.print(f"  [green]+[/] Found dependency: {dep_name}")
-
-        dep_result = check_mod_version(dep_id, version, loader)
-        if dep_result.available:
-            dependency_results.append(dep_result)
-            if download_mod(dep_result, output_dir, parent_progress):
-                console.print(f"    [dim]Downloaded to {output_dir}/{dep_result.filename}[/]")
-            nested_deps = process_dependencies(dep_result, version, loader, processed_mods, output_dir, parent_progress)
-            dependency_results.extend(nested_deps)
+
+    # One bulk /versions call covers the whole starting set, so the per-mod
+    # get_mod_dependencies lookups below are cache hits.
+    bulk_fetch_versions([mod.version_id for mod in queue])
+
+    while queue:
+        # Drain a whole level of the graph at once: all of its new dependency
+        # ids share one bulk project fetch, one concurrent round of version
+        # checks, and one parallel download batch, so the network cost per
+        # level is batch latency instead of a round trip per dependency.
+        level = list(queue)
+        queue.clear()
+
+        level_dep_ids: List[str] = []
+        deps_by_mod: List[tuple] = []
+        for mod_info in level:
+            new_dep_ids = []
+            for dep in get_mod_dependencies(mod_info.version_id):
+                dep_id = dep.get("project_id")
+                if dep_id and dep_id not in processed_mods:
+                    processed_mods.add(dep_id)
+                    new_dep_ids.append(dep_id)
+            level_dep_ids.extend(new_dep_ids)
+            deps_by_mod.append((mod_info, new_dep_ids))
+
+        bulk_fetch_projects(level_dep_ids)
+        dep_results = dict(zip(
+            level_dep_ids,
+            check_mods_concurrently([{"slug": dep_id} for dep_id in level_dep_ids], version, loader),
+        ))
+
+        to_download: List[ModInfo] = []
+        for mod_info, new_dep_ids in deps_by_mod:
+            if new_dep_ids:
+                console.print(f"\n[yellow]Processing dependencies for {mod_info.name}[/]:")
+            for dep_id in new_dep_ids:
+                dep_name = get_mod_name(dep_id)
+                if dep_name:
+                    console.print(f"  [green]+[/] Found dependency: {dep_name}")
+
+                dep_result = dep_results[dep_id]
+                if dep_result.available:
+                    dependency_results.append(dep_result)
+                    to_download.append(dep_result)
+                    queue.append(dep_result)
+
+        # The next level's version documents arrive in one bulk call before
+        # the worklist loops around.
+        bulk_fetch_versions([dep.version_id for dep in to_download])
+
+        downloaded = download_mods(to_download, output_dir, parent_progress)
+        for dep in to_download:
+            if downloaded.get(dep.slug):
+                console.print(f"    [dim]Downloaded to {output_dir}/{dep.filename}[/]")
 
     return dependency_results
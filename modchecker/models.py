@@ -1,23 +1,25 @@
 from dataclasses import dataclass
-from typing import List, Optional, Set, Tuple
+from typing import FrozenSet, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class VersionCheckResult:
     version: str
     compatible: bool
     incompatible_mods: List[Tuple[str, List[str]]]  # (mod_name, available_versions)
 
 
-@dataclass
+@dataclass(slots=True)
 class ModInfo:
     name: str
     slug: str
     url: str
-    versions: List[str]
+    # Immutable after construction; a tuple keeps instances lighter and lets
+    # consumers build frozensets without defensive copies.
+    versions: Tuple[str, ...]
     available: bool
     version_id: Optional[str] = None
-    loader_types: Optional[Set[str]] = None
+    loader_types: Optional[FrozenSet[str]] = None
     download_url: Optional[str] = None
     filename: Optional[str] = None
     error: Optional[str] = None
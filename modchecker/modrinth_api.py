@@ -1,59 +1,288 @@
+import functools
+import json
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, List, Optional, Set
+from urllib.parse import quote
 import requests
 
-from .cache import cache
+from .cache import MAX_CONCURRENT_REQUESTS, cache
 from .models import ModInfo
 from .utils import parse_minecraft_version
 
+# One long-lived pool for every concurrent check in the run, mirroring the
+# single shared HTTP session: repeated scans reuse warm threads instead of
+# paying pool setup/teardown per call.
+_executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix="modrinth")
 
-def check_mod_version(slug: str, target_version: str, loader_type: str) -> ModInfo:
-    cached_data = cache.get_cached_data(slug, target_version, loader_type)
-    if cached_data:
-        return ModInfo(**cached_data)
+# Project metadata prefetched via the bulk /projects endpoint, keyed by both
+# slug and project id so dependency lookups hit it too.
+_projects: Dict[str, dict] = {}
 
-    try:
-        all_data = cache.get_all_data(slug)
-        if not all_data:
-            url = f"https://api.modrinth.com/v2/project/{slug}/version"
+# Modrinth caps how many ids one /projects call may carry.
+BULK_PROJECTS_LIMIT = 100
+
+
+def bulk_fetch_projects(slugs: List[str]) -> Dict[str, dict]:
+    """Fetch project metadata for many slugs with one bulk API call.
+
+    Modrinth's ``/projects?ids=[...]`` endpoint returns every requested
+    project in a single response, replacing one ``/project/{slug}`` round
+    trip per mod. Slugs that already have cached data are skipped; the
+    fetched documents are kept in memory for ``check_mod_version``.
+    """
+    wanted = [slug for slug in slugs if slug not in _projects and not cache.get_all_data(slug)]
+
+    for start in range(0, len(wanted), BULK_PROJECTS_LIMIT):
+        chunk = wanted[start:start + BULK_PROJECTS_LIMIT]
+        try:
+            url = f"https://api.modrinth.com/v2/projects?ids={quote(json.dumps(chunk))}"
             response = cache.make_request(url)
             response.raise_for_status()
-            versions = response.json()
+            for project in response.json():
+                _projects[project["slug"]] = project
+                _projects[project["id"]] = project
+        except requests.exceptions.RequestException:
+            continue  # fall back to per-slug fetches in check_mod_version
+
+    return _projects
+
+
+def bulk_fetch_versions(version_ids: List[str]) -> None:
+    """Prime the dependency cache for many version ids with bulk API calls.
+
+    ``/versions?ids=[...]`` returns every requested version document at
+    once, so subsequent ``get_mod_dependencies`` calls for those ids are
+    cache hits instead of one round trip each.
+    """
+    wanted = [vid for vid in version_ids if vid and not cache.has_cached_data("deps", vid, "all")]
+
+    for start in range(0, len(wanted), BULK_PROJECTS_LIMIT):
+        chunk = wanted[start:start + BULK_PROJECTS_LIMIT]
+        try:
+            url = f"https://api.modrinth.com/v2/versions?ids={quote(json.dumps(chunk))}"
+            response = cache.make_request(url)
+            response.raise_for_status()
+            for version_data in response.json():
+                dependencies = [
+                    dep for dep in version_data.get("dependencies", [])
+                    if dep["dependency_type"] == "required"
+                ]
+                cache.cache_data("deps", version_data["id"], "all", dependencies)
+        except requests.exceptions.RequestException:
+            continue  # fall back to per-version fetches in get_mod_dependencies
+
+
+def check_mods_concurrently(mods: List[Dict[str, str]], target_version: str, loader_type: str) -> List[ModInfo]:
+    """Check all mods against (version, loader) in parallel.
+
+    Each check is a blocking HTTP round trip, so fanning them out over a
+    bounded thread pool collapses N sequential round trips into roughly one.
+    Results are returned in the same order as ``mods``.
+    """
+    return list(_executor.map(
+        lambda mod: check_mod_version(mod["slug"], target_version, loader_type),
+        mods,
+    ))
+
+
+def _get_all_data(slug: str) -> tuple:
+    """Return (project_data, versions) for a slug, fetching at most once.
+
+    Data comes from the on-disk cache when fresh, otherwise from the API
+    (using the bulk-prefetched project map where possible) and is cached for
+    subsequent calls - including evaluations of the same slug against other
+    loaders or versions.
+    """
+    all_data = cache.get_all_data(slug)
+    if all_data:
+        return all_data["project"], all_data["versions"]
+
+    url = f"https://api.modrinth.com/v2/project/{slug}/version"
+    response = cache.make_request(url)
+    response.raise_for_status()
+    versions = response.json()
+
+    project_data = _projects.get(slug)
+    if project_data is None:
+        project_url = f"https://api.modrinth.com/v2/project/{slug}"
+        project_response = cache.make_request(project_url)
+        project_response.raise_for_status()
+        project_data = project_response.json()
+
+    cache.cache_all_data(slug, {"project": project_data, "versions": versions})
+    return project_data, versions
+
+
+def fetch_version_data(slug: str) -> Optional[tuple]:
+    """Return (project_data, versions) for a slug, or None on network failure.
+
+    Thin error-swallowing wrapper for callers that want the raw version
+    documents to evaluate many candidates in memory.
+    """
+    try:
+        return _get_all_data(slug)
+    except requests.exceptions.RequestException:
+        return None
+
+
+def _build_mod_info(slug: str, project_data: dict, versions: List[dict], target_version: str, loader_type: str) -> ModInfo:
+    """Evaluate already-fetched version data against one (version, loader)."""
+    mod_info = ModInfo(
+        name=project_data["title"],
+        slug=slug,
+        url=f"https://modrinth.com/mod/{slug}",
+        versions=(),
+        available=False,
+    )
+
+    # Pass 1: just look for a usable release. In the common case the newest
+    # entry matches, so this exits after one iteration with no accumulation.
+    compatible_version = None
+    for ver in versions:
+        if loader_type in ver["loaders"] and target_version in ver["game_versions"]:
+            compatible_version = ver
+            break
+
+    if compatible_version:
+        mod_info.available = True
+        mod_info.version_id = compatible_version["id"]
+        mod_info.download_url = compatible_version["files"][0]["url"]
+        mod_info.filename = compatible_version["files"][0]["filename"]
+        return mod_info
+
+    # Pass 2 (miss only): collect what the mod does support, for the
+    # alternative-version/loader searches and the report. Previously this
+    # accumulated inline and stopped at the match, so a hit partway through
+    # the list left a truncated version set behind.
+    # The loader alphabet is four strings repeated thousands of times across
+    # version documents; interning collapses them to shared objects.
+    mod_info.loader_types = frozenset(
+        sys.intern(loader) for ver in versions for loader in ver["loaders"]
+    )
+    game_versions = {gv for ver in versions for gv in ver["game_versions"]}
+
+    # Decorate-sort-undecorate: one parse per distinct version instead of
+    # one callback invocation per comparison.
+    decorated = sorted(((parse_minecraft_version(ver), ver) for ver in game_versions), reverse=True)
+    mod_info.versions = tuple(ver for _, ver in decorated)
+    return mod_info
 
-            project_url = f"https://api.modrinth.com/v2/project/{slug}"
-            project_response = cache.make_request(project_url)
-            project_response.raise_for_status()
-            project_data = project_response.json()
 
-            cache.cache_all_data(slug, {"project": project_data, "versions": versions})
+def _error_mod_info(slug: str, error: Exception) -> ModInfo:
+    return ModInfo(
+        name=slug,
+        slug=slug,
+        url=f"https://modrinth.com/mod/{slug}",
+        versions=(),
+        available=False,
+        error=str(error),
+    )
+
+
+def evaluate_loaders(slug: str, target_version: str, loaders) -> Dict[str, ModInfo]:
+    """Check one mod against several loaders with a single data fetch.
+
+    The underlying version list is identical for every loader; only the
+    filter differs, so sweeping all loaders is pure in-memory work once the
+    data is in hand.
+    """
+    try:
+        project_data, versions = _get_all_data(slug)
+    except requests.exceptions.RequestException as e:
+        return {loader: _error_mod_info(slug, e) for loader in loaders}
+
+    return {
+        loader: _build_mod_info(slug, project_data, versions, target_version, loader)
+        for loader in loaders
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def build_support_index(slug: str) -> Optional[Dict[str, frozenset]]:
+    """Map each game version a mod ships for to the loaders that cover it.
+
+    Built once per slug from the cached version documents, the index turns
+    "does this mod support (version, loader)?" into a dict lookup for the
+    version-search loops. Returns None when the data cannot be fetched;
+    callers fall back to check_mod_version. Treated as read-only.
+    """
+    try:
+        _, versions = _get_all_data(slug)
+    except requests.exceptions.RequestException:
+        return None
+
+    accumulated: Dict[str, set] = {}
+    for ver in versions:
+        for game_version in ver["game_versions"]:
+            accumulated.setdefault(game_version, set()).update(ver["loaders"])
+    return {game_version: frozenset(loaders) for game_version, loaders in accumulated.items()}
+
+
+def evaluate_loaders_concurrently(
+    mods: List[Dict[str, str]], target_version: str, loaders
+) -> List[Dict[str, ModInfo]]:
+    """Run evaluate_loaders for every mod in parallel, preserving order.
+
+    Same fan-out as check_mods_concurrently: the single fetch per mod is the
+    blocking part, and the per-loader sweep rides along in the worker.
+    """
+    return list(_executor.map(
+        lambda mod: evaluate_loaders(mod["slug"], target_version, loaders),
+        mods,
+    ))
+
+
+# In-flight request coalescing: several concurrent paths (the main scan, the
+# loader sweep, dependency levels) can ask for the same triple at once, and
+# the lru_cache below only dedupes *completed* calls. The first caller owns
+# the fetch; the rest block on its Future instead of racing to the network.
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def check_mod_version(slug: str, target_version: str, loader_type: str) -> ModInfo:
+    key = (slug, target_version, loader_type)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is None:
+            future = _inflight[key] = Future()
+            owner = True
         else:
-            project_data = all_data["project"]
-            versions = all_data["versions"]
-
-        mod_info = ModInfo(
-            name=project_data["title"],
-            slug=slug,
-            url=f"https://modrinth.com/mod/{slug}",
-            versions=[],
-            available=False,
-        )
+            owner = False
 
-        compatible_version = None
-        for ver in versions:
-            if loader_type in ver["loaders"] and target_version in ver["game_versions"]:
-                compatible_version = ver
-                break
-            mod_info.versions.extend(ver["game_versions"])
-            mod_info.loader_types = mod_info.loader_types or set()
-            mod_info.loader_types.update(ver["loaders"])
+    if not owner:
+        return future.result()
+
+    try:
+        result = _check_mod_version(slug, target_version, loader_type)
+        future.set_result(result)
+        return result
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
 
-        if compatible_version:
-            mod_info.available = True
-            mod_info.version_id = compatible_version["id"]
-            mod_info.download_url = compatible_version["files"][0]["url"]
-            mod_info.filename = compatible_version["files"][0]["filename"]
 
-        mod_info.versions = list(set(mod_info.versions))
-        mod_info.versions.sort(key=lambda x: parse_minecraft_version(x), reverse=True)
+@functools.lru_cache(maxsize=None)
+def _check_mod_version(slug: str, target_version: str, loader_type: str) -> ModInfo:
+    # Memoized for the lifetime of the process: the same (slug, version,
+    # loader) triple is probed by the initial scan, find_best_loader, and the
+    # post-switch reuse paths. Callers treat the returned ModInfo as
+    # read-only, so sharing one instance is safe.
+    cached_data = cache.get_cached_data(slug, target_version, loader_type)
+    if cached_data:
+        cached_data["versions"] = tuple(cached_data.get("versions") or ())
+        if cached_data.get("loader_types"):
+            cached_data["loader_types"] = frozenset(map(sys.intern, cached_data["loader_types"]))
+        return ModInfo(**cached_data)
+
+    try:
+        project_data, versions = _get_all_data(slug)
+        mod_info = _build_mod_info(slug, project_data, versions, target_version, loader_type)
 
         cache.cache_data(
             slug,
@@ -63,7 +292,7 @@ def check_mod_version(slug: str, target_version: str, loader_type: str) -> ModIn
                 "name": mod_info.name,
                 "slug": mod_info.slug,
                 "url": mod_info.url,
-                "versions": mod_info.versions,
+                "versions": list(mod_info.versions),
                 "available": mod_info.available,
                 "version_id": mod_info.version_id,
                 "loader_types": list(mod_info.loader_types) if mod_info.loader_types else None,
@@ -76,19 +305,31 @@ def check_mod_version(slug: str, target_version: str, loader_type: str) -> ModIn
         return mod_info
 
     except requests.exceptions.RequestException as e:
-        return ModInfo(
-            name=slug,
-            slug=slug,
-            url=f"https://modrinth.com/mod/{slug}",
-            versions=[],
-            available=False,
-            error=str(e),
-        )
+        return _error_mod_info(slug, e)
+
+
+# Long-lived embedders reset results between runs through the public name.
+check_mod_version.cache_clear = _check_mod_version.cache_clear
+
+
+def reset_caches() -> None:
+    """Forget all per-run memoized state.
+
+    Covers the version-check memo, the support index (which may hold a None
+    from a transient network failure), and the prefetched project map - so a
+    later run in the same process re-reads the disk cache and honors its TTL
+    instead of reusing stale in-memory results.
+    """
+    _check_mod_version.cache_clear()
+    build_support_index.cache_clear()
+    _projects.clear()
 
 
 def get_mod_dependencies(version_id: str) -> List[Dict[str, str]]:
+    # "No required dependencies" is a perfectly good cached answer; testing
+    # truthiness here would re-fetch every dep-free mod.
     cached_data = cache.get_cached_data("deps", version_id, "all")
-    if cached_data:
+    if cached_data is not None:
         return cached_data
 
     try:
@@ -110,6 +351,10 @@ def get_mod_dependencies(version_id: str) -> List[Dict[str, str]]:
 
 
 def get_mod_name(mod_id: str) -> Optional[str]:
+    prefetched = _projects.get(mod_id)
+    if prefetched:
+        return prefetched.get("title")
+
     cached_data = cache.get_cached_data("names", mod_id, "all")
     if cached_data:
         return cached_data.get("title")
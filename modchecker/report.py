@@ -1,7 +1,8 @@
 from datetime import datetime
-from typing import List
+from typing import Iterator, List
 
 from .models import ModInfo, VersionCheckResult
+from .utils import top_versions
 
 
 def generate_compatibility_report(
@@ -12,46 +13,48 @@ def generate_compatibility_report(
     results: List[ModInfo],
     dependencies: List[ModInfo],
     version_checks: List[VersionCheckResult] | None = None,
-) -> str:
-    report: List[str] = []
+) -> Iterator[str]:
+    """Yield the markdown report line by line.
+
+    Streaming the report keeps peak memory flat regardless of modpack size;
+    the caller writes the lines straight to the open file.
+    """
     now = datetime.now()
 
-    report.append("# Mod Compatibility Report")
-    report.append(f"Generated on: {now.strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("")
+    yield "# Mod Compatibility Report\n"
+    yield f"Generated on: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+    yield "\n"
 
-    report.append("## Configuration Changes")
-    report.append(f"- Original Minecraft Version: {original_version}")
+    yield "## Configuration Changes\n"
+    yield f"- Original Minecraft Version: {original_version}\n"
     if original_version != final_version:
-        report.append(f"- Final Minecraft Version: {final_version} (changed due to compatibility)")
-    report.append(f"- Original Mod Loader: {original_loader}")
+        yield f"- Final Minecraft Version: {final_version} (changed due to compatibility)\n"
+    yield f"- Original Mod Loader: {original_loader}\n"
     if original_loader != final_loader:
-        report.append(f"- Final Mod Loader: {final_loader} (changed due to compatibility)")
-    report.append("")
+        yield f"- Final Mod Loader: {final_loader} (changed due to compatibility)\n"
+    yield "\n"
 
-    report.append("## Compatible Mods")
+    yield "## Compatible Mods\n"
     for mod in results:
         status = "Available" if mod.available else "Not available"
         line = f"- {mod.name}: {status}"
         if mod.available and mod.filename:
             line += f" ({mod.filename})"
-        report.append(line)
-    report.append("")
+        yield f"{line}\n"
+    yield "\n"
 
     if dependencies:
-        report.append("## Dependencies")
+        yield "## Dependencies\n"
         for dep in dependencies:
-            report.append(f"- {dep.name}")
-        report.append("")
+            yield f"- {dep.name}\n"
+        yield "\n"
 
     if version_checks:
-        report.append("## Version Compatibility Checks")
+        yield "## Version Compatibility Checks\n"
         for vc in version_checks:
             comp = "compatible" if vc.compatible else "incompatible"
-            report.append(f"- {vc.version}: {comp}")
+            yield f"- {vc.version}: {comp}\n"
             if vc.incompatible_mods:
                 for mod, avail in vc.incompatible_mods:
-                    report.append(f"  - {mod}: {', '.join(avail[:5])}")
-        report.append("")
-
-    return "\n".join(report)
+                    yield f"  - {mod}: {', '.join(top_versions(avail, 5))}\n"
+        yield "\n"
@@ -1,22 +1,87 @@
+import functools
+import heapq
+import os
 import re
+import sys
 from pathlib import Path
 from typing import Dict, List, Set
 
 from packaging import version
-from rich.console import Console
 
-console = Console()
+# Plain-text mode for CI/scripted runs: decided from argv before any rich
+# import so the whole rich/pygments stack stays out of the cold-start path.
+# argparse still owns the --quiet flag; this early scan only picks the console.
+QUIET = "--quiet" in sys.argv or bool(os.environ.get("MODCHECKER_QUIET"))
 
+# Matches rich style tags ([green], [bold green], [/], ...) so quiet output
+# can reuse the same markup-bearing strings.
+_MARKUP_RE = re.compile(r"\[/?[a-zA-Z][^\[\]]*\]|\[/\]")
 
+
+class PlainConsole:
+    """print()-backed stand-in for rich's Console used in quiet mode."""
+
+    def print(self, *objects, **kwargs) -> None:
+        for obj in objects:
+            print(_MARKUP_RE.sub("", str(obj)))
+
+
+if QUIET:
+    console = PlainConsole()
+else:
+    from rich.console import Console
+
+    console = Console()
+
+# Compiled once at import; extract_modrinth_links can run per invocation in
+# programmatic use, so avoid re-parsing the pattern every call. A single
+# alternation handles both forms in one pass: a markdown link captures
+# (name, url, slug), a bare URL captures only the last slug group.
+_MOD_LINK_RE = re.compile(
+    r"\[([^\]]+)\]\((https://modrinth\.com/mod/([^)/\s]+))\)"
+    r"|https://modrinth\.com/mod/([^/\s)]+)"
+)
+
+
+# Bound once at import so cache misses pay a local load instead of two
+# module-attribute lookups, and malformed versions all share one sentinel.
+_parse = version.parse
+_InvalidVersion = version.InvalidVersion
+_ZERO = _parse("0.0.0")
+
+
+@functools.lru_cache(maxsize=8192)
 def parse_minecraft_version(ver: str) -> version.Version:
+    # The version alphabet across a whole modpack is a few hundred strings,
+    # but they are parsed over and over by every sort and comparison, so the
+    # memo hit rate is effectively 100%.
     try:
-        return version.parse(ver)
-    except version.InvalidVersion:
-        return version.parse("0.0.0")
+        return _parse(ver)
+    except _InvalidVersion:
+        return _ZERO
+
+
+# The same version population gets sorted by several callers over a run;
+# keying on the set of members makes the repeats dictionary lookups. Callers
+# treat the result as read-only.
+_sorted_versions_cache: Dict[frozenset, List[str]] = {}
 
 
 def sort_minecraft_versions(versions: List[str]) -> List[str]:
-    return sorted(versions, key=parse_minecraft_version, reverse=True)
+    key = frozenset(versions)
+    cached = _sorted_versions_cache.get(key)
+    if cached is None:
+        cached = _sorted_versions_cache[key] = sorted(versions, key=parse_minecraft_version, reverse=True)
+    return cached
+
+
+def top_versions(versions: List[str], count: int = 5) -> List[str]:
+    """Return the newest ``count`` versions, newest first.
+
+    Uses a partial selection (O(V log count)) instead of sorting the whole
+    list just to slice off the top few entries.
+    """
+    return heapq.nlargest(count, versions, key=parse_minecraft_version)
 
 
 def extract_modrinth_links(input_file: str) -> List[Dict[str, str]]:
@@ -27,20 +92,15 @@ def extract_modrinth_links(input_file: str) -> List[Dict[str, str]]:
     with open(input_file, "r", encoding="utf-8") as f:
         content = f.read()
 
-    md_pattern = r"\[([^\]]+)\]\((https://modrinth\.com/mod/[^)]+)\)"
-    for match in re.finditer(md_pattern, content):
-        name = match.group(1)
-        url = match.group(2)
-        slug = url.split("/")[-1].split(")")[0]
-        mods.append({"name": name, "url": url, "slug": slug})
+    for match in _MOD_LINK_RE.finditer(content):
+        name, url, slug, bare_slug = match.groups()
+        if bare_slug:
+            name = slug = bare_slug
+            url = f"https://modrinth.com/mod/{bare_slug}"
+        if slug in slugs:
+            continue
         slugs.add(slug)
-
-    url_pattern = r"https://modrinth\.com/mod/([^/\s)]+)"
-    for match in re.finditer(url_pattern, content):
-        slug = match.group(1)
-        if slug not in slugs:
-            mods.append({"name": slug, "url": f"https://modrinth.com/mod/{slug}", "slug": slug})
-            slugs.add(slug)
+        mods.append({"name": name, "url": url, "slug": slug})
 
     if not mods:
         console.print("[yellow]Warning: No Modrinth mod links found in the input file.[/]")
@@ -51,7 +111,22 @@ def extract_modrinth_links(input_file: str) -> List[Dict[str, str]]:
     return mods
 
 
+try:  # optional: single-keypress prompts instead of line-buffered input()
+    import readchar
+except ImportError:
+    readchar = None
+
+
 def prompt_user(question: str) -> bool:
+    if readchar is not None and sys.stdin.isatty():
+        console.print(f"\n{question} (y/n): ", end="")
+        try:
+            key = readchar.readkey().lower()
+            console.print(key)
+            return key == "y"
+        except KeyboardInterrupt:
+            return False
+
     console.print(f"\n{question} (yes/no): ", end="")
     try:
         response = input().lower().strip()
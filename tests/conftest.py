@@ -0,0 +1,56 @@
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+# The repository root lands on sys.path via the pythonpath setting in
+# pyproject.toml, resolved once at session start.
+
+# Stub the third-party modules mod_checker imports so the tests run without
+# the real dependencies installed. pytest loads this conftest once per
+# session, before collecting any test module, so every test file sees the
+# stubs without repeating the block.
+# If mod_checker is already imported (an embedding process, or a previous
+# conftest run in the same interpreter), its dependencies resolved long ago
+# and installing stubs now would do nothing but allocate.
+if 'mod_checker' not in sys.modules:
+    _STUBS = {name: MagicMock(name=name) for name in (
+        'requests',
+        'requests.adapters',
+        'requests.exceptions',
+        'rich',
+        'rich.console',
+        'rich.table',
+        'rich.panel',
+        'rich.progress',
+    )}
+    sys.modules.update({name: stub for name, stub in _STUBS.items() if name not in sys.modules})
+
+
+@pytest.fixture(scope="session")
+def mod_checker():
+    """The application module, imported once for the whole test session.
+
+    Going through a fixture keeps the sys.modules caching explicit and gives
+    every test file the same module object without repeating the import.
+    """
+    import mod_checker
+
+    return mod_checker
+
+
+@pytest.fixture
+def mk_mod(mod_checker):
+    """Factory for ModInfo instances with sensible defaults.
+
+    Tests that only care about a field or two pass just that; construction
+    happens when the factory is called, not at fixture setup.
+    """
+    def _mk(versions, **kwargs):
+        kwargs.setdefault('name', 'X')
+        kwargs.setdefault('slug', kwargs['name'].lower())
+        kwargs.setdefault('url', 'url')
+        kwargs.setdefault('available', True)
+        return mod_checker.ModInfo(versions=versions, **kwargs)
+
+    return _mk